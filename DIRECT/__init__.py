@@ -32,19 +32,24 @@ algorithm can be found in Gablonsky's `thesis <http://repository.lib.ncsu.edu/ir
 # License: EPL.
 
 
+import ctypes
+import functools
+import os
+import threading
 import numpy as np
 from .direct import direct
+from .directbatch import direct as directbatch
 
 __version_info__ = ('1', '0')
 __version__ = '.'.join(__version_info__)
 
 ERROR_MESSAGES = (
-    'Maximum number of levels has been reached.',
-    'An error occured while the function was sampled',
-    'There was an error in the creation of the sample points',
+    'u[i] <= l[i] for some i',
+    'maxf is too large',
     'Initialization failed',
-    'maxf is too large'
-    'u[i] < l[i] for some i'
+    'There was an error in the creation of the sample points',
+    'An error occured while the function was sampled',
+    'Maximum number of levels has been reached.'
 )
 
 SUCCESS_MESSAGES = (
@@ -52,9 +57,399 @@ SUCCESS_MESSAGES = (
     'Number of iterations is equal to maxT',
     'The best function value found is within fglper of the (known) global optimum',
     'The volume of the hyperrectangle with best function value found is below volper',
-    'The volume of the hyperrectangle with best function value found is smaller then volper'
+    'The measure of the hyperrectangle with best function value found is smaller then sigmaper'
+)
+
+
+class DIRECTError(Exception):
+    """
+    Base class of the errors raised when the DIRECT algorithm fails.
+    """
+
+
+class BoundsError(DIRECTError):
+    """
+    The upper bound is not larger than the lower bound for some variable.
+    """
+
+
+class MaxfTooLargeError(DIRECTError):
+    """
+    maxf is larger than the number of points the fortran library can store.
+    """
+
+
+class InitializationError(DIRECTError):
+    """
+    The scaling of the search space failed.
+    """
+
+
+class SamplePointsError(DIRECTError):
+    """
+    The sample points of a hyperrectangle could not be created.
+    """
+
+
+class SamplingError(DIRECTError):
+    """
+    The objective could not be sampled.
+    """
+
+
+class MaxLevelsError(DIRECTError):
+    """
+    The maximum number of levels of division has been reached.
+    """
+
+
+#
+# Exception class and message for every (negative) ierror returned by the
+# fortran library.
+#
+_IERROR_TABLE = {
+    -1: (BoundsError, ERROR_MESSAGES[0]),
+    -2: (MaxfTooLargeError, ERROR_MESSAGES[1]),
+    -3: (InitializationError, ERROR_MESSAGES[2]),
+    -4: (SamplePointsError, ERROR_MESSAGES[3]),
+    -5: (SamplingError, ERROR_MESSAGES[4]),
+    -6: (MaxLevelsError, ERROR_MESSAGES[5])
+}
+
+#
+# Dummy values so that the python wrapper will comply with the required
+# signature of the fortran library. They are empty and never written to,
+# so they are shared by all calls.
+#
+_EMPTY_II = np.ones(0, dtype=np.int32)
+_EMPTY_DD = np.ones(0, dtype=np.float64)
+_EMPTY_CD = np.ones([0,40], dtype=np.uint8)
+_EMPTY_II.setflags(write=False)
+_EMPTY_DD.setflags(write=False)
+_EMPTY_CD.setflags(write=False)
+
+#
+# Logfile name telling the fortran library not to write a logfile.
+#
+_NO_LOGFILE = b''
+
+#
+# The fortran library keeps its work arrays in static storage, so only one
+# optimization can run at a time in a process. Calls from different threads
+# are serialized, and a call made from within an objective, which would
+# overwrite the state of the running optimization, is refused.
+#
+_DRIVER_LOCK = threading.Lock()
+_DRIVER_STATE = threading.local()
+
+#
+# Bindings to the python C-API used to unwrap compiled callbacks.
+#
+_PyCapsule_GetName = ctypes.pythonapi.PyCapsule_GetName
+_PyCapsule_GetName.restype = ctypes.c_char_p
+_PyCapsule_GetName.argtypes = [ctypes.py_object]
+
+_PyCapsule_GetPointer = ctypes.pythonapi.PyCapsule_GetPointer
+_PyCapsule_GetPointer.restype = ctypes.c_void_p
+_PyCapsule_GetPointer.argtypes = [ctypes.py_object, ctypes.c_char_p]
+
+_PyCapsule_New = ctypes.pythonapi.PyCapsule_New
+_PyCapsule_New.restype = ctypes.py_object
+_PyCapsule_New.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_void_p]
+
+#
+# Signature of a compiled objective, in the form accepted by numba.cfunc.
+#
+CFUNC_SIGNATURE = (
+    'void(CPointer(intc), CPointer(float64), CPointer(float64), CPointer(intc), '
+    'CPointer(intc), CPointer(intc), CPointer(float64), CPointer(intc), '
+    'CPointer(uint8), CPointer(intc))'
+)
+
+#
+# Signatures of a compiled objective, in the notation used for the names of
+# the capsules held by scipy.LowLevelCallable. cdata may be declared with
+# any of the byte types.
+#
+_CAPSULE_SIGNATURES = tuple(
+    'void (int *, double *, double *, int *, int *, int *, double *, int *, '
+    '%s *, int *)' % cdata_type
+    for cdata_type in ('char', 'ubyte', 'unsigned char')
+)
+
+#
+# Prototype of a compiled objective, as a ctypes function pointer type.
+#
+OBJECTIVE_CFUNCTYPE = ctypes.CFUNCTYPE(
+    None,
+    ctypes.POINTER(ctypes.c_int),
+    ctypes.POINTER(ctypes.c_double),
+    ctypes.POINTER(ctypes.c_double),
+    ctypes.POINTER(ctypes.c_int),
+    ctypes.POINTER(ctypes.c_int),
+    ctypes.POINTER(ctypes.c_int),
+    ctypes.POINTER(ctypes.c_double),
+    ctypes.POINTER(ctypes.c_int),
+    ctypes.POINTER(ctypes.c_char),
+    ctypes.POINTER(ctypes.c_int)
 )
 
+#
+# ctypes types accepted for cdata, matching the byte types of
+# _CAPSULE_SIGNATURES.
+#
+_CDATA_CTYPES = (ctypes.POINTER(ctypes.c_char), ctypes.POINTER(ctypes.c_ubyte))
+
+
+def _check_prototype(cfuncptr):
+    """
+    Raise ValueError unless the ctypes function pointer cfuncptr has the
+    prototype of OBJECTIVE_CFUNCTYPE (cdata may point to any byte type).
+    """
+
+    #
+    # Foreign functions loaded from a shared library have no argtypes
+    # unless they were declared, so their signature is unknown.
+    #
+    if cfuncptr.argtypes is None:
+        raise ValueError(
+            'the argtypes of ctypes objectives must be declared, e.g. by '
+            'casting them to OBJECTIVE_CFUNCTYPE'
+            )
+
+    argtypes = list(cfuncptr.argtypes)
+    expected = list(OBJECTIVE_CFUNCTYPE._argtypes_)
+    if len(argtypes) == len(expected) and argtypes[8] in _CDATA_CTYPES:
+        argtypes[8] = expected[8]
+
+    if argtypes != expected or cfuncptr.restype is not None:
+        raise ValueError(
+            'Invalid prototype of compiled objective, expected: %s' %
+            _CAPSULE_SIGNATURES[0]
+            )
+
+
+def _native_callback(objective):
+    """
+    Return a compiled objective as a PyCapsule that the fortran library can
+    call directly, or None if the objective is a regular python callable.
+
+    f2py only accepts capsules without a name, so named capsules (e.g. the
+    ones held by ``scipy.LowLevelCallable``) are rewrapped after checking
+    that their name is the expected signature. ctypes function pointers
+    (whose prototype must match :data:`OBJECTIVE_CFUNCTYPE`) and
+    ``numba.cfunc`` objects (through their ctypes function pointer) are
+    wrapped as well.
+    """
+
+    #
+    # numba.cfunc objects expose the compiled function as a ctypes function
+    # pointer, which carries its signature.
+    #
+    cfuncptr = getattr(objective, 'ctypes', None)
+    if isinstance(cfuncptr, ctypes._CFuncPtr):
+        objective = cfuncptr
+
+    if isinstance(objective, ctypes._CFuncPtr):
+        _check_prototype(objective)
+
+        address = ctypes.cast(objective, ctypes.c_void_p).value
+        return _PyCapsule_New(address, None, None)
+
+    capsule = objective
+    if isinstance(objective, tuple) and hasattr(objective, 'signature'):
+        #
+        # scipy.LowLevelCallable is a tuple holding the capsule first.
+        #
+        capsule = tuple.__getitem__(objective, 0)
+
+    if type(capsule).__name__ != 'PyCapsule':
+        return None
+
+    name = _PyCapsule_GetName(capsule)
+    if name is None:
+        return capsule
+
+    if name.decode('ascii', 'replace') not in _CAPSULE_SIGNATURES:
+        raise ValueError(
+            'Invalid signature of compiled objective: %s, expected: %s' %
+            (name.decode('ascii', 'replace'), _CAPSULE_SIGNATURES[0])
+            )
+
+    return _PyCapsule_New(_PyCapsule_GetPointer(capsule, name), None, None)
+
+
+def _serial_callback(objective, user_data, cache):
+    """
+    Return the callback handed to the serial fortran library (direct) for
+    the objective of :func:`solve`.
+    """
+
+    #
+    # The wrappers take only x: f2py only builds as many callback arguments
+    # as the python function accepts, so the unused iidata, ddata, cdata
+    # and sizes are never converted to python objects. user_data is
+    # captured by the closure instead.
+    #
+    def _objective_wrap(x):
+        """
+        To simplify the python objective we use a wrapper objective that complies
+        with the required fortran objective.
+        """
+        return objective(x, user_data)
+
+    evaluations = {}
+
+    def _cached_objective_wrap(x):
+        """
+        Same as _objective_wrap but reuses the values of points that were
+        already evaluated.
+        """
+        key = x.tobytes()
+        if key not in evaluations:
+            evaluations[key] = objective(x, user_data)
+        return evaluations[key]
+
+    #
+    # Compiled objectives are handed to the fortran library as is.
+    #
+    fcn = _native_callback(objective)
+    if fcn is None:
+        fcn = _cached_objective_wrap if cache else _objective_wrap
+    elif user_data is not None:
+        raise ValueError('user_data is not supported with compiled objectives')
+    elif cache:
+        raise ValueError('cache is not supported with compiled objectives')
+
+    return fcn
+
+
+def _batch_callback(objective, user_data):
+    """
+    Return the callback handed to the batch fortran library (directbatch)
+    for the objective of :func:`solve_batch`.
+    """
+
+    #
+    # The batch library calls the objective with a different signature, so
+    # it cannot call compiled objectives written for the serial one.
+    #
+    if _native_callback(objective) is not None:
+        raise ValueError('compiled objectives are not supported by solve_batch')
+
+    def _objective_wrap(x):
+        """
+        The fortran library stores the points as the columns of x. Only x
+        is accepted, so that f2py does not build the n and m arguments.
+        """
+        return objective(x.T, user_data)
+
+    return _objective_wrap
+
+
+def _driver_callback(objective, user_data, cache):
+    """
+    Return the fortran library (direct or directbatch) that solves the
+    objective of :func:`solve` and the callback handed to it.
+    """
+    if getattr(objective, '__batched__', False):
+        if cache:
+            raise ValueError('cache is not supported with batched objectives')
+
+        return directbatch, _batch_callback(objective, user_data)
+
+    return direct, _serial_callback(objective, user_data, cache)
+
+
+def _logfile_argument(logfilename):
+    """
+    Return the name of the logfile as the bytes handed to the fortran
+    library, so that f2py does not have to convert it.
+    """
+    if logfilename is None:
+        return _NO_LOGFILE
+
+    return os.fsencode(logfilename)
+
+
+def _solve(
+    driver,
+    fcn,
+    l,
+    u,
+    eps,
+    maxf,
+    maxT,
+    algmethod,
+    fglobal,
+    fglper,
+    volper,
+    sigmaper,
+    logfilename,
+    out_x,
+    bounds_work=None
+    ):
+    """
+    Call the DIRECT algorithm using one of the fortran drivers (direct or
+    directbatch) and translate its exit status. logfilename must already be
+    encoded by _logfile_argument.
+    """
+
+    #
+    # Call the DIRECT algorithm. l and u are always copied: the fortran
+    # library overwrites them with its scaling factors while it runs and
+    # only restores them on a regular exit, so the caller's arrays must
+    # never be passed through. They are copied into bounds_work, a pair of
+    # arrays of doubles, when it is given and into new arrays otherwise.
+    # The solution is written into out_x, which is only allocated here when
+    # the caller did not supply it. A blank logfilename tells the fortran
+    # library not to write a logfile.
+    #
+    if out_x is None:
+        out_x = np.empty(len(l), dtype=np.float64)
+
+    if getattr(_DRIVER_STATE, 'running', False):
+        raise RuntimeError('DIRECT cannot be called from within an objective')
+
+    with _DRIVER_LOCK:
+        if bounds_work is None:
+            l_work = np.array(l, dtype=np.float64)
+            u_work = np.array(u, dtype=np.float64)
+        else:
+            l_work, u_work = bounds_work
+            np.copyto(l_work, l)
+            np.copyto(u_work, u)
+
+        _DRIVER_STATE.running = True
+        try:
+            fmin, ierror = driver(
+                                fcn,
+                                out_x,
+                                eps,
+                                maxf,
+                                maxT,
+                                l_work,
+                                u_work,
+                                algmethod,
+                                logfilename, 
+                                fglobal,
+                                fglper,
+                                volper,
+                                sigmaper,
+                                _EMPTY_II,
+                                _EMPTY_DD,
+                                _EMPTY_CD
+                                )
+        finally:
+            _DRIVER_STATE.running = False
+
+    if ierror < 0:
+        exc_cls, msg = _IERROR_TABLE[ierror]
+        raise exc_cls(msg)
+        
+    return out_x, fmin, SUCCESS_MESSAGES[ierror-1]
+
+
 def solve(
     objective,
     l,
@@ -67,8 +462,10 @@ def solve(
     fglper=0.01,
     volper=-1.0,
     sigmaper=-1.0,
-    logfilename='DIRresults.txt',
-    user_data=None
+    logfilename=None,
+    user_data=None,
+    cache=False,
+    out_x=None
     ):
     """
     Solve an optimization problem using the DIRECT (Dividing Rectangles) algorithm.
@@ -97,6 +494,34 @@ def solve(
         The function should return a tuple of two values: the objective function
         value at the point x and a value (flag) that is set to 1 if the function
         is not defined at point x (0 if it is defined).
+
+        x is not copied: it is a view of the work array of the fortran library
+        and is overwritten between calls. The objective should not modify it
+        in place, and should copy it if it needs to keep it after returning.
+
+        Alternatively, the objective can be a compiled function given as a
+        ``scipy.LowLevelCallable``, a ``PyCapsule``, a ``numba.cfunc``
+        compiled with :data:`CFUNC_SIGNATURE` or a ctypes function pointer
+        with the prototype :data:`OBJECTIVE_CFUNCTYPE` (e.g. a function
+        loaded from a shared library and cast to it). It is then called
+        directly by the fortran library, avoiding the overhead of calling
+        into python on every function evaluation. The function must follow
+        the fortran calling convention::
+
+            void objective(int *n, double *x, double *f, int *flag,
+                           int *iidata, int *iisize, double *ddata,
+                           int *idsize, char *cdata, int *icsize)
+
+        and store the objective value in ``*f`` and the flag in ``*flag``.
+        ``cdata`` may also be declared as ``unsigned char *``. The signature
+        of compiled objectives is checked, and a ValueError is raised if it
+        does not match (or, for ctypes function pointers, if their argtypes
+        were not declared).
+        ``user_data`` and ``cache`` are not supported with compiled
+        objectives.
+
+        Objectives that have a ``__batched__`` attribute set to True are
+        solved with :func:`solve_batch` (cache is not supported for them).
     
     l : array-like, shape = [n]
         Lower bounds on variables, where n is the dimension of x.
@@ -147,11 +572,25 @@ def solve(
         Terminate the optimization once the measure of the hyperrectangle is less
         than sigmaper.
         
-    logfilename : string, optional (default='DIRresults.txt')
-        Name of logfile.
+    logfilename : string or path, optional (default=None)
+        Name of logfile. No logfile is written if None.
         
     user_data : object, optional (default=None)
         Arbitrary python object used for passing data to the objective function.
+
+    cache : bool, optional (default=False)
+        Remember the value of every evaluated point and reuse it when the
+        algorithm samples the same point again. This mostly happens with
+        ``algmethod=1`` and pays off when the objective is expensive. Points
+        are compared by their exact binary value, so points that differ only
+        by rounding errors are evaluated again. cache is not supported with
+        compiled objectives (a ValueError is raised).
+
+    out_x : array, shape = [n], optional (default=None)
+        Array in which the final point is stored. It must be a contiguous
+        array of doubles and is returned as x. Useful for avoiding an
+        allocation per call when solve is called many times, e.g. in a
+        multi-start loop.
     
     Returns
     -------
@@ -164,45 +603,203 @@ def solve(
     ierror : string
         Status message.
 
+    Raises
+    ------
+    DIRECTError
+        If the optimization fails. The subclass (e.g. :class:`BoundsError`)
+        tells the reason of the failure.
+
     """
-    
-    def _objective_wrap(x, iidata, ddata, cdata, n, iisize, idsize, icsize):
-        """
-        To simplify the python objective we use a wrapper objective that complies
-        with the required fortran objective.
-        """
-        return objective(x, user_data)
-        
-    #
-    # Dummy values so that the python wrapper will comply with the required
-    # signature of the fortran library.
-    #
-    iidata = np.ones(0, dtype=np.int32)
-    ddata = np.ones(0, dtype=np.float64)
-    cdata = np.ones([0,40], dtype=np.uint8)
 
-    #
-    # Call the DIRECT algorithm
-    #
-    x, fmin, ierror = direct(
-                        _objective_wrap,
-                        eps,
-                        maxf,
-                        maxT,
-                        np.array(l, dtype=np.float64),
-                        np.array(u, dtype=np.float64),
-                        algmethod,
-                        logfilename, 
-                        fglobal,
-                        fglper,
-                        volper,
-                        sigmaper,
-                        iidata,
-                        ddata,
-                        cdata
-                        )
+    driver, fcn = _driver_callback(objective, user_data, cache)
 
-    if ierror < 0:
-        raise Exception(ERROR_MESSAGES[abs(ierror)-1])
-        
-    return x, fmin, SUCCESS_MESSAGES[ierror-1]
+    return _solve(
+                driver,
+                fcn,
+                l,
+                u,
+                eps,
+                maxf,
+                maxT,
+                algmethod,
+                fglobal,
+                fglper,
+                volper,
+                sigmaper,
+                _logfile_argument(logfilename),
+                out_x
+                )
+
+
+def solve_batch(
+    objective,
+    l,
+    u,
+    eps=1e-4,
+    maxf=20000,
+    maxT=6000,
+    algmethod=0,
+    fglobal=-1e100,
+    fglper=0.01,
+    volper=-1.0,
+    sigmaper=-1.0,
+    logfilename=None,
+    user_data=None,
+    out_x=None
+    ):
+    """
+    Solve an optimization problem using the DIRECT algorithm, evaluating the
+    objective on several points in a single call.
+
+    When DIRECT divides a hyperrectangle, it samples two new points in each
+    of the directions being divided. :func:`solve` evaluates these points
+    one at a time, while ``solve_batch`` passes them all to the objective,
+    which can then evaluate them in a vectorized way.
+
+    Parameters
+    ----------
+    objective : function pointer
+        Callback function for evaluating objective function.
+        The callback functions accepts two parameters: X (array of shape
+        [m, n] holding the m points at which the objective is to be
+        evaluated) and user_data, an arbitrary data object supplied by the
+        user. The function should return a tuple of two arrays of length m:
+        the objective function values at the points and the flags (see
+        :func:`solve`). Like in :func:`solve`, X is a view that is
+        overwritten between calls. Compiled objectives are not supported.
+
+    Other parameters and the return values are the same as in :func:`solve`.
+
+    """
+
+    return _solve(
+                directbatch,
+                _batch_callback(objective, user_data),
+                l,
+                u,
+                eps,
+                maxf,
+                maxT,
+                algmethod,
+                fglobal,
+                fglper,
+                volper,
+                sigmaper,
+                _logfile_argument(logfilename),
+                out_x
+                )
+
+
+def solve_precompile(
+    l,
+    u,
+    eps=1e-4,
+    maxf=20000,
+    maxT=6000,
+    algmethod=0,
+    fglobal=-1e100,
+    fglper=0.01,
+    volper=-1.0,
+    sigmaper=-1.0,
+    logfilename=None,
+    cache=False
+    ):
+    """
+    Prepare a solver for running many optimizations with the same bounds and
+    settings, e.g. in the inner loop of a hybrid or multi-start method.
+
+    The bounds are converted to arrays of doubles and the logfile name is
+    encoded once. The fortran library overwrites the bounds while it runs,
+    so every call of the returned solver copies them into work arrays that
+    are also allocated once, instead of allocating new ones like
+    :func:`solve`. Passing out_x to the solver avoids allocating x as well.
+    The objective is still wrapped on every call.
+
+    The parameters are the same as in :func:`solve`, except for objective,
+    user_data and out_x.
+
+    Returns
+    -------
+    solver : function
+        A function ``solver(objective, user_data=None, out_x=None)`` that
+        minimizes objective (see :func:`solve`, batched objectives are
+        handled like in :func:`solve`) and returns the same values as
+        :func:`solve`.
+
+    """
+
+    l = np.array(l, dtype=np.float64)
+    u = np.array(u, dtype=np.float64)
+    bounds_work = (np.empty_like(l), np.empty_like(u))
+
+    logfilename = _logfile_argument(logfilename)
+
+    def solver(objective, user_data=None, out_x=None):
+        driver, fcn = _driver_callback(objective, user_data, cache)
+
+        return _solve(
+                    driver,
+                    fcn,
+                    l,
+                    u,
+                    eps,
+                    maxf,
+                    maxT,
+                    algmethod,
+                    fglobal,
+                    fglper,
+                    volper,
+                    sigmaper,
+                    logfilename,
+                    out_x,
+                    bounds_work
+                    )
+
+    return solver
+
+
+def solve_multistart(objectives, l, u, n_workers=None, **kwargs):
+    """
+    Run several independent DIRECT optimizations in parallel.
+
+    The fortran library is not reentrant, so a process can only run one
+    optimization at a time (concurrent calls to :func:`solve` from several
+    threads are serialized). ``solve_multistart`` therefore runs each
+    optimization in a separate worker process.
+
+    Parameters
+    ----------
+    objectives : sequence of function pointers
+        The objective functions, one optimization is run for each. They are
+        passed to :func:`solve` in the worker processes and must therefore
+        be picklable, e.g. functions defined at the module level.
+
+    l : array, shape = [n]
+        Lower bounds on variables, shared by all optimizations.
+
+    u : array, shape = [n]
+        Upper bounds on variables, shared by all optimizations.
+
+    n_workers : int, optional (default=None)
+        Number of worker processes. Defaults to the number of processors.
+
+    Other keyword arguments are passed to :func:`solve`, except for out_x
+    which is not supported.
+
+    Returns
+    -------
+    results : list of tuples
+        The (x, fmin, ierror) tuples returned by :func:`solve`, in the order
+        of objectives.
+
+    """
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    if kwargs.get('out_x') is not None:
+        raise ValueError('out_x is not supported by solve_multistart')
+
+    run = functools.partial(solve, l=l, u=u, **kwargs)
+
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        return list(executor.map(run, objectives))
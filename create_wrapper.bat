@@ -1 +1,2 @@
 f2py.py --build-dir tmp1 --verbose -c --fcompiler=gnu95 --compiler=mingw32 -lmsvcr71 direct.pyf DIRect.f DIRserial.f DIRsubrout.f
+f2py.py --build-dir tmp2 --verbose -c --fcompiler=gnu95 --compiler=mingw32 -lmsvcr71 directbatch.pyf DIRect.f DIRbatch.f DIRsubrout.f
@@ -1,3 +1,4 @@
+import os
 import setuptools
 
 
@@ -35,7 +36,21 @@ def configuration(parent_package='',top_path=None):
                            url = URL,
                            long_description = LONG_DESCRIPTION)
 
-    config.add_extension('direct', sources=['src/direct.pyf', 'src/DIRect.f', 'src/DIRserial.f', 'src/DIRsubrout.f'])
+    #
+    # Setting DIRECT_OPT=1 builds the fortran library with aggressive,
+    # machine specific optimizations. The resulting extension only runs on
+    # CPUs that support the instruction set of the build machine.
+    #
+    if os.environ.get('DIRECT_OPT', '0') == '1':
+        opt_args = dict(
+            extra_f77_compile_args=['-O3', '-march=native', '-funroll-loops', '-flto'],
+            extra_link_args=['-flto']
+        )
+    else:
+        opt_args = {}
+
+    config.add_extension('direct', sources=['src/direct.pyf', 'src/DIRect.f', 'src/DIRserial.f', 'src/DIRsubrout.f'], **opt_args)
+    config.add_extension('directbatch', sources=['src/directbatch.pyf', 'src/DIRect.f', 'src/DIRbatch.f', 'src/DIRsubrout.f'], **opt_args)
 
     return config
 
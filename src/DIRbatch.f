@@ -0,0 +1,250 @@
+C+-----------------------------------------------------------------------+
+C| Program       : Direct.f (subfile DIRbatch.f)                         |
+C| Subroutines, which differ depending on the serial or batch version.   |
+C| In the batch version, all points sampled when a hyperrectangle is     |
+C| divided are passed to the user-supplied function in a single call     |
+C|                                                                       |
+C|       CALL fcn(n, m, x, f, flag)                                      |
+C|                                                                       |
+C| where x is a n by m array holding the m points to evaluate, and f and |
+C| flag are arrays of length m receiving the function values and flags.  |
+C+-----------------------------------------------------------------------+
+
+C+-----------------------------------------------------------------------+
+C| SUBROUTINE for sampling.                                              |
+C+-----------------------------------------------------------------------+
+      SUBROUTINE DIRSamplef(c,ArrayI,delta,sample,new,length,
+     +           dwrit,logfile,f,free,maxI,point,fcn,x,l,fmin,
+     +           minpos,u,n,maxfunc,maxdeep,oops,fmax,
+     +            IFeasiblef,IInfesiblef,
+     +           iidata, iisize, ddata, idsize, cdata, icsize)
+      IMPLICIT NONE
+
+      EXTERNAL fcn
+
+      INTEGER n,maxfunc,maxdeep,oops
+      INTEGER maxI,ArrayI(n),sample,new
+      INTEGER length(maxfunc,n),free,point(maxfunc),i
+      DOUBLE PRECISION c(maxfunc,n),delta,x(n)
+      DOUBLE PRECISION l(n),u(n),f(maxfunc,2)
+      DOUBLE PRECISION fmin
+      INTEGER pos,j,dwrit,logfile,minpos
+      INTEGER helppoint,kret
+      DOUBLE PRECISION fmax
+      INTEGER  IFeasiblef,IInfesiblef
+C+-----------------------------------------------------------------------+
+C| Variables to pass user defined data to the function to be optimized.  |
+C+-----------------------------------------------------------------------+
+      INTEGER iisize, idsize, icsize
+      INTEGER iidata(iisize)
+      DOUBLE PRECISION ddata(idsize)
+      CHARACTER*40 cdata(icsize)
+C+-----------------------------------------------------------------------+
+C| The points to be evaluated (stored one after the other), their        |
+C| function values and flags. At most two points are sampled in each     |
+C| direction. MaxDim must not be smaller than MaxDim in DIRect.f.        |
+C+-----------------------------------------------------------------------+
+      INTEGER MaxDim
+      PARAMETER (MaxDim = 64)
+      DOUBLE PRECISION xbatch(2*MaxDim*MaxDim), fbatch(2*MaxDim)
+      INTEGER kbatch(2*MaxDim), m
+
+C+-----------------------------------------------------------------------+
+C| Set the pointer to the first function to be evaluated,                |
+C| store this position also in helppoint.                                |
+C+-----------------------------------------------------------------------+
+      pos = new
+      helppoint = pos
+      m = maxI + maxI
+C+-----------------------------------------------------------------------+
+C| Make sure the points fit into the batch, instead of writing past it.  |
+C+-----------------------------------------------------------------------+
+      IF ((n .GT. MaxDim) .OR. (m .GT. 2*MaxDim)) THEN
+        oops = 1
+        RETURN
+      END IF
+C+-----------------------------------------------------------------------+
+C| Copy the positions of all points into the batch.                      |
+C+-----------------------------------------------------------------------+
+      DO 40,j=1,m
+         DO 60,i=1,n
+           xbatch((j-1)*n+i) = c(pos,i)
+60       CONTINUE
+         pos = point(pos)
+40    CONTINUE
+C+-----------------------------------------------------------------------+
+C| Call the function once for all points.                                |
+C+-----------------------------------------------------------------------+
+      CALL DIRinfcnb(fcn,xbatch,l,u,n,m,fbatch,kbatch)
+      pos = helppoint
+      DO 45,j=1,m
+         f(pos,1) = fbatch(j)
+         kret = kbatch(j)
+C+-----------------------------------------------------------------------+
+C| Remember IF an infeasible point has been found.                       |
+C+-----------------------------------------------------------------------+
+         IInfesiblef = max(IInfesiblef,kret)
+         IF (kret .eq. 0) then
+C+-----------------------------------------------------------------------+
+C| IF the function evaluation was O.K., set the flag in                  |
+C| f(pos,2). Also mark that a feasible point has been found.             |
+C+-----------------------------------------------------------------------+
+           f(pos,2) = 0.D0
+            IFeasiblef = 0
+           fmax = max(f(pos,1),fmax)
+         END if
+         IF (kret .ge. 1) then
+C+-----------------------------------------------------------------------+
+C|  IF the function could not be evaluated at the given point,           |
+C| set flag to mark this (f(pos,2) and store the maximum                 |
+C| box-sidelength in f(pos,1).                                           |
+C+-----------------------------------------------------------------------+
+           f(pos,2) = 2.D0
+           f(pos,1) = fmax
+         END if
+C+-----------------------------------------------------------------------+
+C|  IF the function could not be evaluated due to a failure in           |
+C| the setup, mark this.                                                 |
+C+-----------------------------------------------------------------------+
+         IF (kret .eq. -1) then
+           f(pos,2) = -1.D0
+         END if
+         pos = point(pos)
+45    CONTINUE
+      pos = helppoint
+C+-----------------------------------------------------------------------+
+C| Iterate over all evaluated points and see, IF the minimal             |
+C| value of the function has changed.  IF this has happEND,              |
+C| store the minimal value and its position in the array.                |
+C| Attention: Only valied values are checked!!                           |
+C+-----------------------------------------------------------------------+
+      DO 50,j=1,m
+        IF ((f(pos,1) .LT. fmin) .and. (f(pos,2) .eq. 0)) THEN
+          fmin = f(pos,1)
+          minpos = pos
+        END IF
+        pos = point(pos)
+50    CONTINUE
+      END
+
+C+-----------------------------------------------------------------------+
+C| Problem-specific Initialisation                                       |
+C+-----------------------------------------------------------------------+
+      SUBROUTINE DIRInitSpecific(x,n,
+     +   iidata, iisize, ddata, idsize, cdata, icsize)
+      IMPLICIT NONE
+      INTEGER n
+      DOUBLE PRECISION x(n)
+C+-----------------------------------------------------------------------+
+C| Variables to pass user defined data to the function to be optimized.  |
+C+-----------------------------------------------------------------------+
+      INTEGER iisize, idsize, icsize
+      INTEGER iidata(iisize)
+      DOUBLE PRECISION ddata(idsize)
+      CHARACTER*40 cdata(icsize)
+      END
+
+C+-----------------------------------------------------------------------+
+C|                                                                       |
+C|                       SUBROUTINE DIRINFCN                             |
+C|                                                                       |
+C| Subroutine DIRinfcn unscales the variable x for use in the            |
+C| user-supplied function evaluation subroutine fcn, which is called with|
+C| a batch holding the single point x. After fcn returns to DIRinfcn,    |
+C| DIRinfcn then rescales x for use by DIRECT.                           |
+C|                                                                       |
+C| See DIRinfcn in DIRserial.f for a description of the arguments.       |
+C+-----------------------------------------------------------------------+
+      subroutine DIRinfcn(fcn,x,c1,c2,n,f,flag,
+     +                  iidata, iisize, ddata, idsize, cdata, icsize)
+
+      implicit none
+      integer n,i, flag
+
+      Double Precision x(n),c1(n),c2(n),f
+      EXTERNAL fcn
+C+-----------------------------------------------------------------------+
+C| Variables to pass user defined data to the function to be optimized.  |
+C+-----------------------------------------------------------------------+
+      INTEGER iisize, idsize, icsize
+      INTEGER iidata(iisize)
+      Double Precision ddata(idsize)
+      Character*40 cdata(icsize)
+
+C+-----------------------------------------------------------------------+
+C| Unscale the variable x.                                               |
+C+-----------------------------------------------------------------------+
+      do 20 i=1,n
+        x(i)=(x(i)+c2(i))*c1(i)
+20    continue
+C+-----------------------------------------------------------------------+
+C| Call the function-evaluation subroutine fcn.                          |
+C+-----------------------------------------------------------------------+
+      f = 0.D0
+      CALL fcn(n,1,x,f,flag)
+
+C+-----------------------------------------------------------------------+
+C| Rescale the variable x.                                               |
+C+-----------------------------------------------------------------------+
+      do 30 i=1,n
+        x(i)=x(i)/c1(i)-c2(i)
+ 30   continue
+      return
+
+      end
+
+C+-----------------------------------------------------------------------+
+C|                                                                       |
+C|                       SUBROUTINE DIRINFCNB                            |
+C|                                                                       |
+C| Subroutine DIRinfcnb unscales the m points stored in x and passes them|
+C| to the user-supplied function evaluation subroutine fcn in one call.  |
+C| The points are not rescaled, x is only a work array.                  |
+C|                                                                       |
+C| On entry                                                              |
+C|                                                                       |
+C|        fcn -- The argument containing the name of the user-supplied   |
+C|               subroutine that returns values for the function to be   |
+C|               minimized.                                              |
+C|                                                                       |
+C|          x -- A double-precision n by m array. The points at which    |
+C|               the function is to be evaluated.                        |
+C|                                                                       |
+C|    c1, c2 -- Double-precision vectors of length n. Used for           |
+C|               unscaling the points.                                   |
+C|                                                                       |
+C|          n -- An integer. The dimension of the problem.               |
+C|          m -- An integer. The number of points.                       |
+C|                                                                       |
+C| On return                                                             |
+C|                                                                       |
+C|          f -- A double-precision vector of length m. The function     |
+C|               values at the points.                                   |
+C|       flag -- An integer vector of length m. The flags returned by    |
+C|               fcn for the points (see flag in DIRinfcn).              |
+C|                                                                       |
+C+-----------------------------------------------------------------------+
+      subroutine DIRinfcnb(fcn,x,c1,c2,n,m,f,flag)
+
+      implicit none
+      integer n,m,i,j,flag(m)
+
+      Double Precision x(n,m),c1(n),c2(n),f(m)
+      EXTERNAL fcn
+
+C+-----------------------------------------------------------------------+
+C| Unscale the points.                                                   |
+C+-----------------------------------------------------------------------+
+      do 20 j=1,m
+        do 10 i=1,n
+          x(i,j)=(x(i,j)+c2(i))*c1(i)
+10      continue
+        f(j) = 0.D0
+20    continue
+C+-----------------------------------------------------------------------+
+C| Call the function-evaluation subroutine fcn.                          |
+C+-----------------------------------------------------------------------+
+      CALL fcn(n,m,x,f,flag)
+      return
+
+      end
@@ -59,10 +59,9 @@ C|       l -- The lower bounds of the hyperbox.                          |
 C|       u -- The upper bounds of the hyperbox.                          |
 C|algmethod-- Choose the method, that is either use the original method  |
 C|            as described by Jones et.al. (0) or use our modification(1)|
-C| logfile -- File-Handle for the logfile. DIRECT expects this file to be|
-C|            opened and closed by the user outside of DIRECT. We moved  |
-C|            this to the outside so the user can add extra informations |
-C|            to this file before and after the call to DIRECT.          |
+C| logfilename -- Name of the logfile. DIRECT opens this file, writes    |
+C|            its log to it and closes it again. If logfilename is blank,|
+C|            no logfile is written.                                     |
 C| fglobal -- Function value of the global optimum. If this value is not |
 C|            known (that is, we solve a real problem, not a testproblem)|
 C|            set this value to -1.D100 and fglper (see below) to 0.D0.  |
@@ -142,7 +141,8 @@ C+-----------------------------------------------------------------------+
 C| The maximum of function evaluations allowed.                          |
 C| The maximum dept of the algorithm.                                    |
 C| The maximum number of divisions allowed.                              |
-C| The maximal dimension of the problem.                                 |
+C| The maximal dimension of the problem. The batch buffers in DIRbatch.f |
+C| are sized with their own MaxDim, which must not be smaller.           |
 C+-----------------------------------------------------------------------+
       INTEGER maxfunc, maxdeep, maxdiv, MaxDim, mdeep
       PARAMETER (Maxfunc = 90000)
@@ -302,10 +302,15 @@ C+-----------------------------------------------------------------------+
 C|                            Start of code.                             |
 C+-----------------------------------------------------------------------+
 C+-----------------------------------------------------------------------+
-C|  Define and open the logfile                                          |
+C|  Define and open the logfile. A blank logfilename means that no       |
+C|  logfile is written, which is marked by setting logfile to 0.         |
 C+-----------------------------------------------------------------------+
-      logfile    = 2
-      open(logfile, file=logfilename)
+      IF (logfilename .EQ. ' ') THEN
+        logfile  = 0
+      ELSE
+        logfile  = 2
+        open(logfile, file=logfilename)
+      END IF
 
 C+-----------------------------------------------------------------------+
       writed = 0
@@ -386,7 +391,7 @@ C+-----------------------------------------------------------------------+
       CALL DIRpreprc(u,l,n,l,u,oops)
       IF (oops .GT. 0) THEN
         Write(*,10005)
-        Write(logfile,10005)
+        IF (logfile .GT. 0) Write(logfile,10005)
         IError = -3
         Return
       END IF
@@ -408,12 +413,12 @@ C+-----------------------------------------------------------------------+
       IF (Ierror .lt. 0) then
          IF (Ierror .eq. -4) THEN
             Write(*,10006)
-            Write(logfile,10006)
+            IF (logfile .GT. 0) Write(logfile,10006)
             return
          END IF
          IF (Ierror .eq. -5) THEN
             Write(*,10007)
-            Write(logfile,10007)
+            IF (logfile .GT. 0) Write(logfile,10007)
             return
          END IF
       END IF
@@ -429,10 +434,10 @@ C| the iteration, the number of function evaluations done and fmin.      |
 C+-----------------------------------------------------------------------+
       IF (Ifeasiblef .gt. 0) then
         write(*,10012) tstart-1,numfunc
-        write(logfile,10012) t,numfunc
+        IF (logfile .GT. 0) write(logfile,10012) t,numfunc
       ELSE
         Write(*,10002) numfunc, fmin, fmax
-        Write(logfile,10003) tstart-1,numfunc,fmin
+        IF (logfile .GT. 0) Write(logfile,10003) tstart-1,numfunc,fmin
       END IF
 C+-----------------------------------------------------------------------+
 C+-----------------------------------------------------------------------+
@@ -462,10 +467,12 @@ C+-----------------------------------------------------------------------+
               Write(*,10021)
               Write(*,10022)
               Write(*,10023)
-              Write(logfile,10020)
-              Write(logfile,10021)
-              Write(logfile,10022)
-              Write(logfile,10023)
+              IF (logfile .GT. 0) THEN
+                Write(logfile,10020)
+                Write(logfile,10021)
+                Write(logfile,10022)
+                Write(logfile,10023)
+              END IF
               return
           END IF
         ENDIF
@@ -492,7 +499,7 @@ C| dept, stop the computation.                                           |
 C+-----------------------------------------------------------------------+
               IF (actdeep+1 .GE. mdeep) THEN
                  Write(*,10004)
-                 write(logfile,10004)
+                 IF (logfile .GT. 0) write(logfile,10004)
                  Ierror = -6
                  GOTO 100
               END IF
@@ -525,7 +532,7 @@ C+-----------------------------------------------------------------------+
      +             fcn,x,l,fmin,minpos,u,n,maxfunc,maxdeep,oops)
               IF (oops .GT. 0) THEN
                 Write(*,10006)
-                Write(logfile,10006)
+                IF (logfile .GT. 0) Write(logfile,10006)
                 IError = -4
                 return
               END IF
@@ -540,7 +547,7 @@ C+-----------------------------------------------------------------------+
      +            iidata, iisize, ddata, idsize, cdata, icsize)
               IF (oops .GT. 0) THEN
                 Write(*,10007)
-                Write(logfile,10007)
+                IF (logfile .GT. 0) Write(logfile,10007)
                 IError = -5
                 return
               END IF
@@ -570,7 +577,7 @@ C| in the array.                                                         |
 C+-----------------------------------------------------------------------+
         IF (oldpos .LT. minpos) THEN
           Write(*,10002) numfunc,fmin, fmax
-          Write(logfile,10003) t,numfunc,fmin
+          IF (logfile .GT. 0) Write(logfile,10003) t,numfunc,fmin
         END IF
 C+-----------------------------------------------------------------------+
 C| If no feasible point has been found, give out the iteration, the      |
@@ -578,7 +585,7 @@ C| number of function evaluations and a warning.                         |
 C+-----------------------------------------------------------------------+
         IF (Ifeasiblef .gt. 0) then
           write(*,10012) t,numfunc
-          write(logfile,10012) t,numfunc
+          IF (logfile .GT. 0) write(logfile,10012) t,numfunc
         END IF
 C+-----------------------------------------------------------------------+
 C+-----------------------------------------------------------------------+
@@ -605,7 +612,7 @@ C+-----------------------------------------------------------------------+
         IF (delta .LE. volper) THEN
            Ierror = 4
            Write(*,10011) delta, volper
-           Write(logfile,10011) delta, volper
+           IF (logfile .GT. 0) Write(logfile,10011) delta, volper
            GOTO 100
         END IF
 C+-----------------------------------------------------------------------+
@@ -618,7 +625,7 @@ C+-----------------------------------------------------------------------+
         IF (delta .LE. sigmaper) THEN
            Ierror = 5
            Write(*,10013) delta, sigmaper
-           Write(logfile,10013) delta, sigmaper
+           IF (logfile .GT. 0) Write(logfile,10013) delta, sigmaper
            GOTO 100
         END IF
 C+-----------------------------------------------------------------------+
@@ -630,7 +637,7 @@ C+-----------------------------------------------------------------------+
      +   THEN
            Ierror = 3
            Write(*,10010)
-           Write(logfile,10010)
+           IF (logfile .GT. 0) Write(logfile,10010)
            GOTO 100
         END IF
 C+-----------------------------------------------------------------------+
@@ -661,7 +668,7 @@ C+-----------------------------------------------------------------------+
         IF (increase .eq. 1) then        
            maxf = numfunc + oldmaxf
            IF (Ifeasiblef .eq. 0) then
-             write(logfile,10031) maxf
+             IF (logfile .GT. 0) write(logfile,10031) maxf
              increase = 0
            END IF
         END IF
@@ -675,11 +682,11 @@ C+-----------------------------------------------------------------------+
            IF (Ifeasiblef .eq. 0) then
               Ierror = 1
               Write(*,10008)
-              Write(logfile,10008)
+              IF (logfile .GT. 0) Write(logfile,10008)
               GOTO 100
            ELSE
               increase = 1
-              write(logfile,10030) numfunc
+              IF (logfile .GT. 0) write(logfile,10030) numfunc
               maxf = numfunc+ oldmaxf
            END IF
         END IF
@@ -695,7 +702,7 @@ C| The algorithm stopped after maxT iterations.                          |
 C+-----------------------------------------------------------------------+
       Ierror = 2
       Write(*,10009)
-      Write(logfile,10009)
+      IF (logfile .GT. 0) Write(logfile,10009)
 
 100   CONTINUE
 C+-----------------------------------------------------------------------+
@@ -730,7 +737,7 @@ C+-----------------------------------------------------------------------+
 C+-----------------------------------------------------------------------+
 C| Close the logfile.                                                    |
 C+-----------------------------------------------------------------------+
-      close(logfile)
+      IF (logfile .GT. 0) close(logfile)
       
 C+-----------------------------------------------------------------------+
 C| Format statements.                                                    |
@@ -386,3 +386,79 @@ C+-----------------------------------------------------------------------+
 C| End of problem-specific initialisation                                |
 C+-----------------------------------------------------------------------+
       end
+
+C+-----------------------------------------------------------------------+
+C|                                                                       |
+C|                       SUBROUTINE DIRINFCN                             |
+C|                                                                       |
+C| Subroutine DIRinfcn unscales the variable x for use in the            |
+C| user-supplied function evaluation subroutine fcn. After fcn returns   |
+C| to DIRinfcn, DIRinfcn then rescales x for use by DIRECT.              |
+C|                                                                       |
+C| On entry                                                              |
+C|                                                                       |
+C|        fcn -- The argument containing the name of the user-supplied   |
+C|               subroutine that returns values for the function to be   |
+C|               minimized.                                              |
+C|                                                                       |
+C|          x -- A double-precision vector of length n. The point at     |
+C|               which the function is to be evaluated.                  |
+C|                                                                       |
+C|     c1, c2 -- Double-precision vectors of length n. Used for          |
+C|               unscaling and rescaling the vector x.                   |
+C|                                                                       |
+C|          n -- An integer. The dimension of the problem.               |
+C|                                                                       |
+C| iidata, iisize, ddata, idsize, cdata, icsize -- The user defined data |
+C|               passed on to fcn.                                       |
+C|                                                                       |
+C| On return                                                             |
+C|                                                                       |
+C|          f -- A double-precision scalar. The function value at x.     |
+C|       flag -- An Integer. If flag =  1, the point is infeasible,      |
+C|                              flag = -1, bad problem set up,           |
+C|                              flag =  0, feasible.                     |
+C|                                                                       |
+C| Subroutines and Functions                                             |
+C|                                                                       |
+C| The subroutine whose name is passed through the argument fcn.         |
+C|                                                                       |
+C+-----------------------------------------------------------------------+
+      subroutine DIRinfcn(fcn,x,c1,c2,n,f,flag,
+     +                  iidata, iisize, ddata, idsize, cdata, icsize)
+
+      implicit none
+      integer n,i, flag
+
+      Double Precision x(n),c1(n),c2(n),f
+      EXTERNAL fcn
+C+-----------------------------------------------------------------------+
+C| Variables to pass user defined data to the function to be optimized.  |
+C+-----------------------------------------------------------------------+
+      INTEGER iisize, idsize, icsize
+      INTEGER iidata(iisize)
+      Double Precision ddata(idsize)
+      Character*40 cdata(icsize)
+
+
+C+-----------------------------------------------------------------------+
+C| Unscale the variable x.                                               |
+C+-----------------------------------------------------------------------+
+      do 20 i=1,n
+        x(i)=(x(i)+c2(i))*c1(i)
+20    continue
+C+-----------------------------------------------------------------------+
+C| Call the function-evaluation subroutine fcn.                          |
+C+-----------------------------------------------------------------------+
+      f = 0.D0
+      CALL fcn(n,x,f,flag,iidata, iisize, ddata, idsize, cdata, icsize)
+
+C+-----------------------------------------------------------------------+
+C| Rescale the variable x.                                               |
+C+-----------------------------------------------------------------------+
+      do 30 i=1,n
+        x(i)=x(i)/c1(i)-c2(i)
+ 30   continue
+      return
+
+      end
@@ -445,9 +445,11 @@ C+-----------------------------------------------------------------------+
                pos = point(pos)
             end if
             if (pos .eq. 0) then
+               IF (logfile .GT. 0) THEN
                write(logfile,*) 'Error in DIRREsortlist: We went ',
      + 'through the whole list and could not find the point to 
      +  replace!!'
+               END IF
                goto 20
             end if
 10       continue
@@ -1139,82 +1141,6 @@ C+-----------------------------------------------------------------------+
         return
         end
 
-C+-----------------------------------------------------------------------+
-C|                                                                       |
-C|                       SUBROUTINE DIRINFCN                             |
-C|                                                                       |
-C| Subroutine DIRinfcn unscales the variable x for use in the            |
-C| user-supplied function evaluation subroutine fcn. After fcn returns   |
-C| to DIRinfcn, DIRinfcn then rescales x for use by DIRECT.              |
-C|                                                                       |
-C| On entry                                                              |
-C|                                                                       |
-C|        fcn -- The argument containing the name of the user-supplied   |
-C|               subroutine that returns values for the function to be   |
-C|               minimized.                                              |
-C|                                                                       |
-C|          x -- A double-precision vector of length n. The point at     |
-C|               which the derivative is to be evaluated.                |
-C|                                                                       |
-C|        xs1 -- A double-precision vector of length n. Used for         |
-C|               scaling and unscaling the vector x by DIRinfcn.         |
-C|                                                                       |
-C|        xs2 -- A double-precision vector of length n. Used for         |
-C|               scaling and unscaling the vector x by DIRinfcn.         |
-C|                                                                       |
-C|          n -- An integer. The dimension of the problem.               |
-C|       kret -- An Integer. If kret =  1, the point is infeasible,      |
-C|                              kret = -1, bad problem set up,           |
-C|                              kret =  0, feasible.                     |
-C|                                                                       |
-C| On return                                                             |
-C|                                                                       |
-C|          f -- A double-precision scalar.                              |
-C|                                                                       |
-C| Subroutines and Functions                                             |
-C|                                                                       |
-C| The subroutine whose name is passed through the argument fcn.         |
-C|                                                                       |
-C+-----------------------------------------------------------------------+
-      subroutine DIRinfcn(fcn,x,c1,c2,n,f,flag,
-     +                  iidata, iisize, ddata, idsize, cdata, icsize)
-
-      implicit none
-      integer n,i, flag
-
-      Double Precision x(n),c1(n),c2(n),f
-      EXTERNAL fcn
-C+-----------------------------------------------------------------------+
-C| Variables to pass user defined data to the function to be optimized.  |
-C+-----------------------------------------------------------------------+
-      INTEGER iisize, idsize, icsize
-      INTEGER iidata(iisize)
-      Double Precision ddata(idsize)
-      Character*40 cdata(icsize)
-
-
-C+-----------------------------------------------------------------------+
-C| Unscale the variable x.                                               |
-C+-----------------------------------------------------------------------+
-      do 20 i=1,n
-        x(i)=(x(i)+c2(i))*c1(i)
-20    continue
-C+-----------------------------------------------------------------------+
-C| Call the function-evaluation subroutine fcn.                          |
-C+-----------------------------------------------------------------------+
-      f = 0.D0
-      CALL fcn(n,x,f,flag,iidata, iisize, ddata, idsize, cdata, icsize)
-
-C+-----------------------------------------------------------------------+
-C| Rescale the variable x.                                               |
-C+-----------------------------------------------------------------------+
-      do 30 i=1,n
-        x(i)=x(i)/c1(i)-c2(i)
- 30   continue
-      return
-
-      end
-
 C+-----------------------------------------------------------------------+
 C| Subroutines to output the iteration history (with boxes) to a file.   |
 C+-----------------------------------------------------------------------+
@@ -1271,7 +1197,7 @@ C+-----------------------------------------------------------------------+
       
       Integer Imainver, Isubver, Isubsubver, Ihelp, numerrors
 
-      Write(logfile,900)
+      IF (logfile .GT. 0) Write(logfile,900)
       numerrors = 0
       IError = 0
       Imainver = INT(version/100)
@@ -1294,7 +1220,8 @@ C+-----------------------------------------------------------------------+
         epsfix = 1.D100
       endif
       
-      write(logfile,100) Imainver, Isubver, Isubsubver
+      IF (logfile .GT. 0) write(logfile,100) Imainver, Isubver,
+     +                                       Isubsubver
       write(*,100) Imainver, Isubver, Isubsubver
 C+-----------------------------------------------------------------------+
 C| JG 07/16/01 Removed printout of contents in cdata(1).                 |
@@ -1318,36 +1245,39 @@ C+-----------------------------------------------------------------------+
 C| JG 07/16/01 Removed printout of contents in cdata(1).                 |
 C+-----------------------------------------------------------------------+
 C      write(logfile,*) cdata(1)
-      write(logfile,200) n
-      write(logfile,201) eps
-      write(logfile,202) maxf
-      write(logfile,203) maxT
-      write(logfile,204) fglobal
-      write(logfile,205) fglper
-      write(logfile,208) volper
-      write(logfile,209) sigmaper
-      if (iepschange .eq. 1) then
-         write(logfile,206)
-      else
-         write(logfile,207)
-      end if
+      IF (logfile .GT. 0) THEN
+         write(logfile,200) n
+         write(logfile,201) eps
+         write(logfile,202) maxf
+         write(logfile,203) maxT
+         write(logfile,204) fglobal
+         write(logfile,205) fglper
+         write(logfile,208) volper
+         write(logfile,209) sigmaper
+         if (iepschange .eq. 1) then
+            write(logfile,206)
+         else
+            write(logfile,207)
+         end if
+      END IF
       if (algmethod .eq. 0) then
          write(*,*) 'Jones original DIRECT algorithm is used.'
-         write(logfile,*) 'Jones original DIRECT algorithm is used.'
+         IF (logfile .GT. 0) write(logfile,*)
+     +      'Jones original DIRECT algorithm is used.'
       else
          write(*,*) 'Our modification of the DIRECT algorithm is used.'
-         write(logfile,*) 'Our modification of the DIRECT algorithm',
-     +                    ' is used.'
+         IF (logfile .GT. 0) write(logfile,*)
+     +      'Our modification of the DIRECT algorithm is used.'
       end if
       do 1010, i = 1,n
          IF (u(i) .le. l(i)) then
             Ierror = -1
             write(*,153) i,l(i), u(i)
-            write(logfile,153) i,l(i), u(i)
+            IF (logfile .GT. 0) write(logfile,153) i,l(i), u(i)
             numerrors = numerrors + 1
          else
             write(*,152) i,l(i), u(i)
-            write(logfile,152) i,l(i), u(i)
+            IF (logfile .GT. 0) write(logfile,152) i,l(i), u(i)
          end if
 1010  continue
 C+-----------------------------------------------------------------------+
@@ -1357,25 +1287,26 @@ C| occurred, we give out an extra message.                               |
 C+-----------------------------------------------------------------------+
       IF ((maxf+20) .GT. maxfunc) THEN
          Write(*,10001) maxf, maxfunc
-         Write(logfile,10001) maxf, maxfunc
+         IF (logfile .GT. 0) Write(logfile,10001) maxf, maxfunc
          numerrors = numerrors + 1
          IError = -2
       END IF
       if (IError .lt. 0) then
-         write(logfile,120)
+         IF (logfile .GT. 0) write(logfile,120)
          write(*,120)
          if (numerrors .eq. 1) then
             write(*,105)
-            write(logfile,105)
+            IF (logfile .GT. 0) write(logfile,105)
          else
             write(*,110) numerrors
-            write(logfile,110) numerrors
+            IF (logfile .GT. 0) write(logfile,110) numerrors
          end if
       end if
-      write(logfile,120)
+      IF (logfile .GT. 0) write(logfile,120)
       write(*,120)
       if (IError .ge. 0) then
-         write(logfile,*) 'Iteration   # of f-eval.   fmin'
+         IF (logfile .GT. 0) write(logfile,*)
+     +      'Iteration   # of f-eval.   fmin'
       end if
 
 10001 FORMAT("WARNING : The maximum number of function evaluations (",
@@ -1418,6 +1349,10 @@ C+-----------------------------------------------------------------------+
       Double Precision x(n), l(n), u(n)
       Double Precision fglobal , fmin
 
+C+-----------------------------------------------------------------------+
+C| Nothing to do if no logfile was opened.                               |
+C+-----------------------------------------------------------------------+
+      IF (logfile .LE. 0) RETURN
       Write(logfile,900)
       Write(logfile,1000) fmin
       Write(logfile,1010) numfunc
@@ -0,0 +1,45 @@
+#!/usr/bin/python
+"""
+Solve the problem of test_direct.py using a compiled objective.
+
+The objective is compiled with numba and called directly by the fortran
+library, so no python code runs during the optimization. The same function
+can also be passed as ``scipy.LowLevelCallable(sphere.ctypes)``.
+"""
+
+from __future__ import print_function
+from DIRECT import solve, CFUNC_SIGNATURE
+import numpy as np
+from numba import cfunc, carray
+
+trans = np.array([-1, 2, -4, 3], dtype=np.float64)
+
+
+@cfunc(CFUNC_SIGNATURE)
+def sphere(n, x, f, flag, iidata, iisize, ddata, idsize, cdata, icsize):
+    """Shifted sphere, the result is stored in f[0] and flag[0]"""
+
+    xs = carray(x, n[0])
+    s = 0.0
+    for i in range(n[0]):
+        d = xs[i] - trans[i]
+        s += d*d
+
+    f[0] = s
+    flag[0] = 0
+
+
+if __name__ == '__main__':
+
+    l = np.array([-10, -10, -10, -10], dtype=np.float64)
+    u = np.array([10, 10, 10, 10], dtype=np.float64)
+
+    x, fmin, ierror = solve(
+                        sphere,
+                        l,
+                        u
+                        )
+
+    print('Optimal point:', x)
+    print('Optimal value:', fmin)
+    print('Exit status:', ierror)
@@ -1,10 +1,11 @@
+from __future__ import print_function
 from DIRECT import solve
 import numpy as np
 
 trans = np.array([-1, 2, -4, 3])
 
 def func(x, user_data):
-    x -= trans
+    x = x - trans
     return np.dot(x, x), 0
 
 
@@ -19,8 +20,28 @@ if __name__ == '__main__':
                         u
                         )
 
-    print 'Optimal point:', x
-    print 'Optimal value:', fmin
-    print 'Exit status:', ierror
+    print('Optimal point:', x)
+    print('Optimal value:', fmin)
+    print('Exit status:', ierror)
+
+    #
+    # Solve the problem again with the compiled version of the objective
+    # (see fast_objective.py), which should find the same optimum.
+    #
+    try:
+        from fast_objective import sphere
+    except ImportError:
+        print('numba is not installed, skipping the compiled objective.')
+    else:
+        xc, fminc, ierrorc = solve(
+                                sphere,
+                                l,
+                                u
+                                )
+
+        print('Compiled objective optimal point:', xc)
+        print('Compiled objective optimal value:', fminc)
+        assert np.allclose(xc, x) and np.allclose(fminc, fmin)
+        assert ierrorc == ierror
     
     